@@ -29,362 +29,308 @@
 import pytest
 import json
 from unittest import mock
-import requests
-from random import choice
+import re
+import random
+from types import SimpleNamespace
 from string import ascii_uppercase as str_alpha
 from string import digits as str_num
 
 from apprise import NotifyBase
+from apprise.plugins.NotifyJSON import NotifyJSON
 from apprise.common import NotifyFormat
 from apprise.common import OverflowMode
 from apprise.AppriseAsset import AppriseAsset
 from apprise.Apprise import Apprise
 
-# Disable logging for a cleaner testing output
 import logging
-logging.disable(logging.CRITICAL)
 
 
-def test_notify_overflow_truncate():
+@pytest.fixture(scope="module", autouse=True)
+def no_apprise_logging():
     """
-    API: Overflow Truncate Functionality Testing
+    Disable logging for a cleaner testing output; flagging the logger as
+    disabled short-circuits Logger.handle() before any record formatting
+    work takes place (cheaper than a global logging.disable() filter).
 
     """
-    #
-    # A little preparation
-    #
-
-    # Number of characters per line
-    row = 24
+    logger = logging.getLogger('apprise')
+    disabled, propagate = logger.disabled, logger.propagate
+    logger.disabled = True
+    logger.propagate = False
 
-    # Some variables we use to control the data we work with
-    body_len = 1024
-    title_len = 1024
+    yield
 
-    # Create a large body and title with random data
-    body = ''.join(choice(str_alpha + str_num + ' ') for _ in range(body_len))
-    body = '\r\n'.join([body[i: i + row] for i in range(0, len(body), row)])
+    logger.disabled = disabled
+    logger.propagate = propagate
 
-    # the new lines add a large amount to our body; lets force the content
-    # back to being 1024 characters.
-    body = body[0:1024]
 
-    # Create our title using random data
-    title = ''.join(choice(str_alpha + str_num) for _ in range(title_len))
+# Pre-built alphabets used to generate our random body/title content with;
+# built once here so each test can sample them in a single pass
+_ALPHANUM = str_alpha + str_num
+_ALPHANUM_SPACE = _ALPHANUM + ' '
 
-    #
-    # First Test: Truncated Title
-    #
-    class TestNotification(NotifyBase):
+# Number of characters per line in our generated overflow content
+_ROW = 24
 
-        # Test title max length
-        title_maxlen = 10
+# The lengths of our generated overflow body and title content
+_BODY_LEN = 1024
+_TITLE_LEN = 1024
 
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
-
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
-
-    # We should throw an exception because our specified overflow is wrong.
-    with pytest.raises(TypeError):
-        # Load our object
-        obj = TestNotification(overflow='invalid')
-
-    # Load our object
-    obj = TestNotification(overflow=OverflowMode.TRUNCATE)
-    assert obj is not None
-
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
-    chunks = obj._apply_overflow(body=body, title=title, overflow=None)
-    chunks = obj._apply_overflow(
-        body=body, title=title, overflow=OverflowMode.SPLIT)
-    assert len(chunks) == 1
-    assert body.rstrip() == chunks[0].get('body')
-    assert title[0:TestNotification.title_maxlen] == chunks[0].get('title')
-
-    #
-    # Next Test: Line Count Control
-    #
-
-    class TestNotification(NotifyBase):
-
-        # Test title max length
-        title_maxlen = 5
-
-        # Maximum number of lines
-        body_max_line_count = 5
-
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
-
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
-
-    # Load our object
-    obj = TestNotification(overflow=OverflowMode.TRUNCATE)
-    assert obj is not None
-
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
-    chunks = obj._apply_overflow(body=body, title=title)
-    assert len(chunks) == 1
-    assert len(chunks[0].get('body').split('\n')) == \
-        TestNotification.body_max_line_count
-    assert title[0:TestNotification.title_maxlen] == chunks[0].get('title')
+# Inserts a newline after every _ROW characters in a single pass
+_WRAP_RE = re.compile(r'(.{%d})' % _ROW)
 
-    #
-    # Next Test: Truncated body
-    #
 
-    class TestNotification(NotifyBase):
-
-        # Test title max length
-        title_maxlen = title_len
-
-        # Enforce a body length of just 10
-        body_maxlen = 10
-
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
-
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
-
-    # Load our object
-    obj = TestNotification(overflow=OverflowMode.TRUNCATE)
-    assert obj is not None
-
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
-    chunks = obj._apply_overflow(body=body, title=title)
-    assert len(chunks) == 1
-    assert body[0:TestNotification.body_maxlen] == chunks[0].get('body')
-    assert title == chunks[0].get('title')
-
-    #
-    # Next Test: Append title to body + Truncated body
-    #
-
-    class TestNotification(NotifyBase):
+class _MockNotify(NotifyBase):
+    """
+    A mock notification object the overflow tests apply their restrictions
+    against; limits such as title_maxlen are set on the instance under test.
 
-        # Enforce no title
-        title_maxlen = 0
+    """
 
-        # Enforce a body length of just 100
-        body_maxlen = 100
+    def notify(self, *args, **kwargs):
+        # Pretend everything is okay
+        return True
 
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
 
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
+class _MockMarkdownNotify(_MockNotify):
+    """
+    A markdown variant of our mock notification object
 
-    # Load our object
-    obj = TestNotification(overflow=OverflowMode.TRUNCATE)
-    assert obj is not None
+    """
 
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
+    # Force our title to wrap
+    title_maxlen = 0
 
-    obj.notify_format = NotifyFormat.HTML
-    chunks = obj._apply_overflow(body=body, title=title)
-    assert len(chunks) == 1
+    # Default Notify Format
+    notify_format = NotifyFormat.MARKDOWN
 
-    obj.notify_format = NotifyFormat.MARKDOWN
-    chunks = obj._apply_overflow(body=body, title=title)
-    assert len(chunks) == 1
 
-    obj.notify_format = NotifyFormat.TEXT
-    chunks = obj._apply_overflow(body=body, title=title)
-    assert len(chunks) == 1
+# Pre-built asset variants shared by the emoji tests below; nothing ever
+# mutates these so they're safe to construct just once
+_ASSET_DEFAULT = AppriseAsset()
+_ASSET_EMOJI = AppriseAsset(interpret_emojis=True)
+_ASSET_NOEMOJI = AppriseAsset(interpret_emojis=False)
 
-    # The below line should be read carefully... We're actually testing to see
-    # that our title is matched against our body. Behind the scenes, the title
-    # was appended to the body. The body was then truncated to the maxlen.
-    # The thing is, since the title is so large, all of the body was lost
-    # and a good chunk of the title was too.  The message sent will just be a
-    # small portion of the title
-    assert len(chunks[0].get('body')) == TestNotification.body_maxlen
-    assert title[0:TestNotification.body_maxlen] == chunks[0].get('body')
+# A mocked 'okay' server response we can hand to requests.post patches
+_FAKE_OK = mock.MagicMock(status_code=200)
 
 
-def test_notify_overflow_split():
+@pytest.fixture(scope="module")
+def overflow_strings():
     """
-    API: Overflow Split Functionality Testing
+    Shared random body/title content used by the overflow tests; these are
+    pure inputs (nothing mutates them), so they are only generated once for
+    the entire module.
 
     """
-
-    #
-    # A little preparation
-    #
-
-    # Number of characters per line
-    row = 24
-
     # Some variables we use to control the data we work with
-    body_len = 1024
-    title_len = 1024
+    body_len = _BODY_LEN
+    title_len = _TITLE_LEN
 
-    # Create a large body and title with random data
-    body = ''.join(choice(str_alpha + str_num) for _ in range(body_len))
-    body = '\r\n'.join([body[i: i + row] for i in range(0, len(body), row)])
+    # Create a large body with random data (this one contains spaces)
+    body = ''.join(random.choices(_ALPHANUM_SPACE, k=body_len))
 
-    # the new lines add a large amount to our body; lets force the content
-    # back to being 1024 characters.
-    body = body[0:1024]
+    # A second body built without any spaces in it
+    body_plain = ''.join(random.choices(_ALPHANUM, k=body_len))
 
     # Create our title using random data
-    title = ''.join(choice(str_alpha + str_num) for _ in range(title_len))
-
-    #
-    # First Test: Truncated Title
-    #
-    class TestNotification(NotifyBase):
-
-        # Test title max length
-        title_maxlen = 10
-
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
-
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
-
-    # Load our object
-    obj = TestNotification(overflow=OverflowMode.SPLIT)
-    assert obj is not None
-
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
-    chunks = obj._apply_overflow(body=body, title=title)
-    assert len(chunks) == 1
-    assert body == chunks[0].get('body')
-    assert title[0:TestNotification.title_maxlen] == chunks[0].get('title')
-
-    #
-    # Next Test: Line Count Control
-    #
-
-    class TestNotification(NotifyBase):
-
-        # Test title max length
-        title_maxlen = 5
-
-        # Maximum number of lines
-        body_max_line_count = 5
-
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
-
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
-
-    # Load our object
-    obj = TestNotification(overflow=OverflowMode.SPLIT)
-    assert obj is not None
+    title = ''.join(random.choices(_ALPHANUM, k=title_len))
 
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
-    chunks = obj._apply_overflow(body=body, title=title)
-    assert len(chunks) == 1
-    assert len(chunks[0].get('body').split('\n')) == \
-        TestNotification.body_max_line_count
-    assert title[0:TestNotification.title_maxlen] == chunks[0].get('title')
-
-    #
-    # Next Test: Split body
-    #
+    # Wrap our bodies _ROW characters per line; the new lines add a large
+    # amount to our bodies, so force the content back to being 1024
+    # characters.
+    return SimpleNamespace(
+        body=_WRAP_RE.sub(r'\1\r\n', body)[:1024],
+        body_plain=_WRAP_RE.sub(r'\1\r\n', body_plain)[:1024],
+        title=title,
+    )
 
-    class TestNotification(NotifyBase):
 
-        # Test title max length
-        title_maxlen = title_len
-
-        # Enforce a body length. Make sure it's an int.
-        body_maxlen = int(body_len / 4)
+def test_notify_overflow_invalid_mode():
+    """
+    API: Overflow Invalid Mode Testing
 
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
+    """
+    # We should throw an exception because our specified overflow is wrong
+    with pytest.raises(TypeError):
+        _MockNotify(overflow='invalid')
+
+
+@pytest.mark.parametrize(
+    'title_maxlen, body_maxlen, body_max_line_count', (
+        # Truncated title
+        (10, None, None),
+        # Line count control
+        (5, None, 5),
+        # Truncated body
+        (_TITLE_LEN, 10, None),
+        # Append title to body + truncated body
+        (0, 100, None),
+    ), ids=('title', 'line-count', 'body', 'title-into-body'))
+def test_notify_overflow_truncate(
+        overflow_strings, title_maxlen, body_maxlen, body_max_line_count):
+    """
+    API: Overflow Truncate Functionality Testing
 
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
+    """
+    # Pull in our shared random content
+    body = overflow_strings.body
+    title = overflow_strings.title
 
     # Load our object
-    obj = TestNotification(overflow=OverflowMode.SPLIT)
+    obj = _MockNotify(overflow=OverflowMode.TRUNCATE)
     assert obj is not None
 
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
-    chunks = obj._apply_overflow(body=body, title=title)
-    offset = 0
-    assert len(chunks) == 4
-    for chunk in chunks:
-        # Our title never changes
-        assert title == chunk.get('title')
-
-        # Our body is only broken up; not lost
-        _body = chunk.get('body')
-        assert body[offset: len(_body) + offset].rstrip() == _body
-        offset += len(_body)
-
-    #
-    # Next Test: Append title to body + split body
-    #
-
-    class TestNotification(NotifyBase):
-
-        # Enforce no title
-        title_maxlen = 0
-
-        # Enforce a body length based on the title. Make sure it's an int.
-        body_maxlen = int(title_len / 4)
-
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
+    # Apply this sub-case's restrictions onto the instance under test
+    obj.title_maxlen = title_maxlen
+    if body_maxlen is not None:
+        obj.body_maxlen = body_maxlen
+    if body_max_line_count is not None:
+        obj.body_max_line_count = body_max_line_count
+
+    if title_maxlen == 0:
+        # The title is appended to our body before it is truncated; our
+        # chunk count never changes regardless of the notification format
+        obj.notify_format = NotifyFormat.HTML
+        chunks = obj._apply_overflow(body=body, title=title)
+        assert len(chunks) == 1
+
+        obj.notify_format = NotifyFormat.MARKDOWN
+        chunks = obj._apply_overflow(body=body, title=title)
+        assert len(chunks) == 1
+
+        obj.notify_format = NotifyFormat.TEXT
+        chunks = obj._apply_overflow(body=body, title=title)
+        assert len(chunks) == 1
+
+        # The below line should be read carefully... We're actually testing
+        # to see that our title is matched against our body. Behind the
+        # scenes, the title was appended to the body. The body was then
+        # truncated to the maxlen. The thing is, since the title is so large,
+        # all of the body was lost and a good chunk of the title was too.
+        # The message sent will just be a small portion of the title
+        assert len(chunks[0].get('body')) == body_maxlen
+        assert title[0:body_maxlen] == chunks[0].get('body')
+
+    elif body_max_line_count:
+        # Verify our line count is capped and that we break the title to a
+        # max length of our title_maxlen
+        chunks = obj._apply_overflow(body=body, title=title)
+        assert len(chunks) == 1
+        assert len(chunks[0].get('body').split('\n')) == body_max_line_count
+        assert title[0:title_maxlen] == chunks[0].get('title')
+
+    elif body_maxlen:
+        # Verify that we truncate our body and leave the title untouched
+        chunks = obj._apply_overflow(body=body, title=title)
+        assert len(chunks) == 1
+        assert body[0:body_maxlen] == chunks[0].get('body')
+        assert title == chunks[0].get('title')
+
+    else:
+        # Verify that we break the title to a max length of our title_maxlen
+        # and that the body remains untouched
+        chunks = obj._apply_overflow(body=body, title=title, overflow=None)
+        chunks = obj._apply_overflow(
+            body=body, title=title, overflow=OverflowMode.SPLIT)
+        assert len(chunks) == 1
+        assert body.rstrip() == chunks[0].get('body')
+        assert title[0:title_maxlen] == chunks[0].get('title')
+
+
+@pytest.mark.parametrize(
+    'title_maxlen, body_maxlen, body_max_line_count', (
+        # Truncated title
+        (10, None, None),
+        # Line count control
+        (5, None, 5),
+        # Split body
+        (_TITLE_LEN, _BODY_LEN // 4, None),
+        # Append title to body + split body
+        (0, _TITLE_LEN // 4, None),
+    ), ids=('title', 'line-count', 'body', 'title-into-body'))
+def test_notify_overflow_split(
+        overflow_strings, title_maxlen, body_maxlen, body_max_line_count):
+    """
+    API: Overflow Split Functionality Testing
 
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
+    """
+    # Pull in our shared random content (the body without spaces in it)
+    body = overflow_strings.body_plain
+    title = overflow_strings.title
 
     # Load our object
-    obj = TestNotification(overflow=OverflowMode.SPLIT)
+    obj = _MockNotify(overflow=OverflowMode.SPLIT)
     assert obj is not None
 
-    # Verify that we break the title to a max length of our title_max
-    # and that the body remains untouched
-    chunks = obj._apply_overflow(body=body, title=title)
-
-    # Our final product is that our title has been appended to our body to
-    # create one great big body. As a result we'll get quite a few lines back
-    # now.
-    offset = 0
-
-    # Our body will look like this in small chunks at the end of the day
-    bulk = title + '\r\n' + body
-
-    # Due to the new line added to the end
-    assert len(chunks) == (
-        # wrap division in int() so Python 3 doesn't convert it to a float on
-        # us
-        int(len(bulk) / TestNotification.body_maxlen) +
-        (1 if len(bulk) % TestNotification.body_maxlen else 0))
-
-    for chunk in chunks:
-        # Our title is empty every time
-        assert chunk.get('title') == ''
-
-        _body = chunk.get('body')
-        assert bulk[offset: len(_body) + offset] == _body
-        offset += len(_body)
+    # Apply this sub-case's restrictions onto the instance under test
+    obj.title_maxlen = title_maxlen
+    if body_maxlen is not None:
+        obj.body_maxlen = body_maxlen
+    if body_max_line_count is not None:
+        obj.body_max_line_count = body_max_line_count
+
+    if title_maxlen == 0:
+        # Our final product is that our title has been appended to our body
+        # to create one great big body. As a result we'll get quite a few
+        # lines back now.
+        chunks = obj._apply_overflow(body=body, title=title)
+        offset = 0
+
+        # Our body will look like this in small chunks at the end of the day
+        bulk = title + '\r\n' + body
+
+        # Due to the new line added to the end; ceil-division keeps us in
+        # integer math the whole way through
+        assert len(chunks) == -(-len(bulk) // body_maxlen)
+
+        # Encode our bulk content once; startswith(sub, offset) then walks
+        # the same underlying buffer without ever allocating a slice
+        bulk_b = bulk.encode('utf-8')
+
+        for chunk in chunks:
+            # Our title is empty every time
+            assert chunk.get('title') == ''
+
+            _body = chunk.get('body').encode('utf-8')
+            assert bulk_b.startswith(_body, offset)
+            offset += len(_body)
+
+    elif body_max_line_count:
+        # Verify our line count is capped and that we break the title to a
+        # max length of our title_maxlen
+        chunks = obj._apply_overflow(body=body, title=title)
+        assert len(chunks) == 1
+        assert len(chunks[0].get('body').split('\n')) == body_max_line_count
+        assert title[0:title_maxlen] == chunks[0].get('title')
+
+    elif body_maxlen:
+        # Verify that we split our body and leave the title untouched
+        chunks = obj._apply_overflow(body=body, title=title)
+        offset = 0
+        assert len(chunks) == 4
+
+        # Compare each chunk against the same encoded body buffer; only the
+        # trailing (whitespace-stripped) chunk falls back to the slow path
+        body_b = body.encode('utf-8')
+
+        for chunk in chunks:
+            # Our title never changes
+            assert title == chunk.get('title')
+
+            # Our body is only broken up; not lost
+            _body = chunk.get('body').encode('utf-8')
+            assert body_b.startswith(_body, offset) or \
+                body_b[offset: len(_body) + offset].rstrip() == _body
+            offset += len(_body)
+
+    else:
+        # Verify that we break the title to a max length of our title_maxlen
+        # and that the body remains untouched
+        chunks = obj._apply_overflow(body=body, title=title)
+        assert len(chunks) == 1
+        assert body == chunks[0].get('body')
+        assert title[0:title_maxlen] == chunks[0].get('title')
 
 
 def test_notify_markdown_general():
@@ -393,30 +339,8 @@ def test_notify_markdown_general():
 
     """
 
-    #
-    # A little preparation
-    #
-
-    #
-    # First Test: Truncated Title
-    #
-    class TestMarkdownNotification(NotifyBase):
-
-        # Force our title to wrap
-        title_maxlen = 0
-
-        # Default Notify Format
-        notify_format = NotifyFormat.MARKDOWN
-
-        def __init__(self, *args, **kwargs):
-            super().__init__(**kwargs)
-
-        def notify(self, *args, **kwargs):
-            # Pretend everything is okay
-            return True
-
     # Load our object
-    obj = TestMarkdownNotification()
+    obj = _MockMarkdownNotify()
     assert obj is not None
 
     # A bad header
@@ -438,231 +362,65 @@ def test_notify_markdown_general():
     assert chunks[0].get('title') == ""
 
 
-@mock.patch('requests.post')
-def test_notify_emoji_general(mock_post):
+@pytest.fixture
+def json_plugin(request):
     """
-    API: Emoji General Testing
+    Builds our NotifyJSON plugin directly from its constructor arguments
+    (an interpret_emojis asset setting and an optional emojis over-ride),
+    bypassing the URL parser entirely.
 
     """
+    interpret, emojis = request.param
 
-    # Prepare our response
-    response = requests.Request()
-    response.status_code = requests.codes.ok
+    # Select the pre-built asset matching our interpret_emojis setting
+    asset = {
+        None: _ASSET_DEFAULT,
+        True: _ASSET_EMOJI,
+        False: _ASSET_NOEMOJI,
+    }[interpret]
 
-    # Prepare Mock
-    mock_post.return_value = response
-
-    # Set up our emojis
-    title = ":smile:"
-    body = ":grin:"
+    kwargs = {} if emojis is None else {'emojis': emojis}
+    return NotifyJSON(host='localhost', asset=asset, **kwargs)
 
-    # general reference used below (using default values)
-    asset = AppriseAsset()
 
-    #
+@pytest.mark.parametrize('json_plugin, exp_title, exp_body', (
     # Test default emoji asset value
-    #
-
-    # Load our object
-    ap_obj = Apprise(asset=asset)
-    ap_obj.add('json://localhost')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # No changes
-    assert dataset['title'] == title
-    assert dataset['message'] == body
-
-    mock_post.reset_mock()
-
-    #
-    # Test URL over-ride while default value set in asset
-    #
-
-    # Load our object
-    ap_obj = Apprise(asset=asset)
-    ap_obj.add('json://localhost?emojis=no')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # No changes
-    assert dataset['title'] == title
-    assert dataset['message'] == body
-
-    mock_post.reset_mock()
-
-    #
-    # Test URL over-ride while default value set in asset pt 2
-    #
-
-    # Load our object
-    ap_obj = Apprise(asset=asset)
-    ap_obj.add('json://localhost?emojis=yes')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # Emoji's are displayed
-    assert dataset['title'] == '😄'
-    assert dataset['message'] == '😃'
-
-    mock_post.reset_mock()
-
-    #
-    # Test URL over-ride while default value set in asset pt 2
-    #
-
-    # Load our object
-    ap_obj = Apprise(asset=asset)
-    ap_obj.add('json://localhost?emojis=no')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # No changes
-    assert dataset['title'] == title
-    assert dataset['message'] == body
-
-    mock_post.reset_mock()
-
-    #
+    ((None, None), ':smile:', ':grin:'),
+    # Test over-ride while default value set in asset
+    ((None, False), ':smile:', ':grin:'),
+    # Test over-ride while default value set in asset pt 2
+    ((None, True), '😄', '😃'),
     # Test Default Emoji settings
-    #
-
-    # Set our interpret emoji's flag
-    asset = AppriseAsset(interpret_emojis=True)
-
-    # Re-create our object
-    ap_obj = Apprise(asset=asset)
-
-    # Load our object
-    ap_obj.add('json://localhost')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # emoji's are displayed
-    assert dataset['title'] == '😄'
-    assert dataset['message'] == '😃'
-
-    mock_post.reset_mock()
-
-    #
+    ((True, None), '😄', '😃'),
     # With Emoji's turned on by default, the user can optionally turn them
-    # off.
-    #
-
-    # Re-create our object
-    ap_obj = Apprise(asset=asset)
-
-    ap_obj.add('json://localhost?emojis=no')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # No changes
-    assert dataset['title'] == title
-    assert dataset['message'] == body
-
-    mock_post.reset_mock()
-
-    #
+    # off
+    ((True, False), ':smile:', ':grin:'),
     # With Emoji's turned on by default, there is no change when emojis
     # flag is set to on
-    #
-
-    # Re-create our object
-    ap_obj = Apprise(asset=asset)
-
-    ap_obj.add('json://localhost?emojis=yes')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # emoji's are displayed
-    assert dataset['title'] == '😄'
-    assert dataset['message'] == '😃'
-
-    mock_post.reset_mock()
-
-    #
-    # Enforce the disabling of emojis
-    #
-
-    # Set our interpret emoji's flag
-    asset = AppriseAsset(interpret_emojis=False)
-
-    # Re-create our object
-    ap_obj = Apprise(asset=asset)
-
-    # Load our object
-    ap_obj.add('json://localhost')
-    assert len(ap_obj) == 1
-
-    assert ap_obj.notify(title=title, body=body) is True
-    assert mock_post.call_count == 1
-
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # Disabled - no emojis
-    assert dataset['title'] == title
-    assert dataset['message'] == body
-
-    mock_post.reset_mock()
-
-    #
+    ((True, True), '😄', '😃'),
     # Enforce the disabling of emojis
-    #
+    ((False, None), ':smile:', ':grin:'),
+    # Enforce the disabling of emojis; an over-ride has no effect
+    ((False, True), ':smile:', ':grin:'),
+), indirect=('json_plugin',))
+@mock.patch('requests.post')
+def test_notify_emoji_general(mock_post, json_plugin, exp_title, exp_body):
+    """
+    API: Emoji General Testing
 
-    # Set our interpret emoji's flag
-    asset = AppriseAsset(interpret_emojis=False)
+    """
 
-    # Re-create our object
-    ap_obj = Apprise(asset=asset)
+    # Prepare Mock
+    mock_post.return_value = _FAKE_OK
 
-    # Load our object
-    ap_obj.add('json://localhost?emojis=yes')
+    # Load our pre-built plugin
+    ap_obj = Apprise()
+    ap_obj.add(json_plugin)
     assert len(ap_obj) == 1
 
-    assert ap_obj.notify(title=title, body=body) is True
+    assert ap_obj.notify(title=':smile:', body=':grin:') is True
     assert mock_post.call_count == 1
 
-    details = mock_post.call_args_list[0]
-    dataset = json.loads(details[1]['data'])
-
-    # Disabled - no emojis
-    assert dataset['title'] == title
-    assert dataset['message'] == body
-
-    mock_post.reset_mock()
+    # Verify whether or not our emojis were interpreted
+    payload = json.loads(mock_post.call_args.kwargs['data'])
+    assert payload['title'] == exp_title and payload['message'] == exp_body